@@ -0,0 +1,47 @@
+"""Бенчмарк времени холодного импорта клиента
+
+Запуск: poetry run python benchmarks/import_time.py [--runs 10]
+Каждый замер - отдельный процесс Python, поэтому кэш sys.modules не влияет на результат.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ('utils.api_client', 'utils.client_pool', 'utils.helpers')
+HEAVY_MODULES = ('requests', 'urllib3', 'dotenv', 'uuid')
+
+_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def measure_import(modules=MODULES) -> dict:
+    """Один замер холодного импорта в новом процессе: время (мс) и загруженные тяжёлые модули"""
+    snippet = _SNIPPET.format(modules=tuple(modules), heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, '-c', snippet],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='количество замеров')
+    args = parser.parse_args()
+    
+    results = [measure_import() for _ in range(args.runs)]
+    timings = [result['ms'] for result in results]
+    print(f"Импорт {', '.join(MODULES)} ({args.runs} запусков):")
+    print(f"  min {min(timings):.1f} мс, median {statistics.median(timings):.1f} мс, max {max(timings):.1f} мс")
+    print(f"  тяжёлые модули при импорте: {results[0]['loaded'] or 'нет'}")
+
+if __name__ == '__main__':
+    main()
@@ -3,18 +3,23 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils.api_client import YandexDiskClient
-from utils.config import Config
+from utils.config import get_config
 from utils.helpers import generate_unique_name
 
 @pytest.fixture(scope="session")
-def api_client():
+def config():
+    """Фикстура для конфигурации (окружение и .env)"""
+    return get_config()
+
+@pytest.fixture(scope="session")
+def api_client(config):
     """Фикстура для клиента API"""
-    return YandexDiskClient()
+    return YandexDiskClient(config=config)
 
 @pytest.fixture(scope="session")
-def test_prefix():
+def test_prefix(config):
     """Фикстура для префикса тестовых ресурсов"""
-    return Config.TEST_PREFIX
+    return config.test_prefix
 
 @pytest.fixture
 def unique_folder_name(test_prefix):
@@ -42,9 +47,9 @@ def test_folder(api_client, unique_folder_name, request):
     api_client.delete_resource(unique_folder_name, permanently=True)
 
 @pytest.fixture
-def test_file_path():
+def test_file_path(config):
     """Путь к тестовому файлу"""
-    return Config.TEST_FILE_PATH
+    return config.test_file_path
 
 @pytest.fixture
 def test_file_content(test_file_path):
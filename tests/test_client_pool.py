@@ -0,0 +1,318 @@
+import io
+import json
+import pytest
+import requests
+from utils.client_pool import YandexDiskClientPool
+from utils.helpers import assert_status_code, wait_for_resource
+
+DOWNLOAD_HREF = 'https://downloader.disk.yandex.ru/file'
+UPLOAD_HREF = 'https://uploader.disk.yandex.net/file'
+
+class FakeSession:
+    """Подмена requests.Session: отвечает на запросы ссылок, скачивания и загрузки без сети"""
+    
+    def __init__(self, content: bytes = b'', download_href=DOWNLOAD_HREF, upload_href=UPLOAD_HREF,
+                 download_status: int = 200, used_space: int = 0, total_space: int = 100,
+                 resources=()):
+        self.content = content
+        self.resources = {f'disk:/{path}' for path in resources}
+        self.disk = {'used_space': used_space, 'total_space': total_space}
+        self.download_status = download_status
+        self.hrefs = {'/resources/download': download_href, '/resources/upload': upload_href}
+        self.uploads = []
+        self.closed = []
+    
+    def _response(self, status_code: int, body: bytes = b'', stream: bool = False) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        if stream:
+            response.raw = io.BytesIO(body)
+            close = response.close
+            
+            def close_and_record():
+                self.closed.append(response)
+                close()
+            
+            response.close = close_and_record
+        else:
+            response._content = body
+        return response
+    
+    def request(self, method, url, **kwargs):
+        if url.endswith('/disk/'):
+            return self._response(200, json.dumps(self.disk).encode())
+        for endpoint, href in self.hrefs.items():
+            if url.endswith(endpoint):
+                if href is None:
+                    return self._response(404)
+                return self._response(200, json.dumps({'href': href}).encode())
+        if url.endswith('/resources'):
+            found = kwargs['params']['path'] in self.resources
+            return self._response(200 if found else 404, b'{}')
+        if url == DOWNLOAD_HREF:
+            return self._response(self.download_status, self.content, stream=kwargs.get('stream', False))
+        if url == UPLOAD_HREF:
+            data = kwargs['data']
+            self.uploads.append({'data': data, 'body': b''.join(data)})
+            return self._response(201)
+        return self._response(404)
+
+class TestClientPool:
+    """Тесты для пула клиентов нескольких аккаунтов"""
+    
+    @pytest.mark.smoke
+    def test_path_routing_is_stable(self):
+        """Тест: Путь всегда направляется на один и тот же аккаунт"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c'])
+        
+        for i in range(50):
+            path = f"folder_{i}/file.txt"
+            assert pool.hashed_client_for_path(path) is pool.hashed_client_for_path(path), \
+                "Один и тот же путь направлен на разные аккаунты"
+            # Файлы внутри папки живут на аккаунте папки
+            assert pool.hashed_client_for_path(path) is pool.hashed_client_for_path(f"folder_{i}"), \
+                "Файл и его папка направлены на разные аккаунты"
+        
+        used = {id(pool.hashed_client_for_path(f"folder_{i}")) for i in range(200)}
+        assert len(used) == len(pool), "Пути распределены не по всем аккаунтам"
+    
+    def test_adding_account_moves_few_paths(self):
+        """Тест: При добавлении аккаунта переезжает лишь часть путей"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c'])
+        bigger_pool = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c', 'token_d'])
+        
+        paths = [f"folder_{i}" for i in range(1000)]
+        moved = sum(
+            pool.hashed_client_for_path(path).token != bigger_pool.hashed_client_for_path(path).token
+            for path in paths
+        )
+        assert moved < len(paths) / 2, f"Слишком много путей сменили аккаунт: {moved}"
+    
+    def test_routing_ignores_token_order(self):
+        """Тест: Порядок токенов и удаление одного из них не перемещают пути остальных"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c'])
+        reordered = YandexDiskClientPool(tokens=['token_b', 'token_a', 'token_c'])
+        without_b = YandexDiskClientPool(tokens=['token_a', 'token_c'])
+        
+        for i in range(1000):
+            path = f"folder_{i}"
+            token = pool.hashed_client_for_path(path).token
+            assert reordered.hashed_client_for_path(path).token == token, \
+                f"Смена порядка токенов переместила {path}"
+            if token != 'token_b':
+                assert without_b.hashed_client_for_path(path).token == token, \
+                    f"Удаление другого аккаунта переместило {path}"
+    
+    def test_least_loaded_client_and_metrics(self):
+        """Тест: Выбор наименее загруженного клиента и суммарные метрики"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b'])
+        busy, idle = pool.clients
+        
+        with busy.metrics.track():
+            assert pool.least_loaded_client() is idle, \
+                "Выбран клиент с запросом в работе"
+            assert pool.get_metrics()['in_flight'] == 1
+        
+        with idle.metrics.track():
+            pass
+        
+        metrics = pool.get_metrics()
+        assert metrics['requests'] == 2, "Неверное суммарное число запросов"
+        assert metrics['in_flight'] == 0, "Остались незавершённые запросы"
+        assert metrics['errors'] == 0, "Неверное суммарное число ошибок"
+    
+    def test_least_loaded_client_breaks_ties_round_robin(self):
+        """Тест: В новом пуле (все счётчики равны) клиенты выбираются по кругу"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c'])
+        
+        chosen = [pool.least_loaded_client() for _ in range(6)]
+        
+        assert {id(client) for client in chosen} == {id(client) for client in pool.clients}, \
+            "При равной нагрузке выбирается один и тот же клиент"
+    
+    def test_place_path_spreads_by_disk_usage(self):
+        """Тест: Новые папки размещаются по занятому месту, при равенстве - по кругу"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c'])
+        for client in pool.clients:
+            client._session = FakeSession(used_space=10, total_space=100)
+        
+        placed = [pool.place_path(f"new_folder_{i}") for i in range(6)]
+        assert {id(client) for client in placed} == {id(client) for client in pool.clients}, \
+            "При равном занятом месте все папки размещены на одном аккаунте"
+        
+        emptiest = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c'])
+        for client, used in zip(emptiest.clients, (50, 5, 90)):
+            client._session = FakeSession(used_space=used, total_space=100)
+        
+        for i in range(6):
+            assert emptiest.place_path(f"new_folder_{i}") is emptiest.clients[1], \
+                "Папка размещена не на самом свободном аккаунте"
+        # Информация о диске запрашивается один раз на пул
+        assert all(client.metrics.requests == 1 for client in emptiest.clients), \
+            "Занятое место запрашивается повторно"
+    
+    def test_placed_path_is_routed_to_its_account(self):
+        """Тест: Ресурс, размещённый на самом свободном аккаунте, находится через роутер"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b'])
+        full, free = pool.clients
+        full._session = FakeSession(used_space=90, total_space=100)
+        free._session = FakeSession(used_space=10, total_space=100)
+        
+        for i in range(30):
+            folder = f"placed_{i}"
+            placed = pool.place_path(f"{folder}/file.txt")
+            
+            assert placed is free, "Папка размещена не на самом свободном аккаунте"
+            assert pool.client_for_path(folder) is placed, \
+                "Роутер не нашёл размещённую папку"
+            assert pool.client_for_path(f"{folder}/nested/file.txt") is placed, \
+                "Роутер не нашёл файл внутри размещённой папки"
+            assert pool.place_path(folder) is placed, \
+                "Повторное размещение перенесло папку на другой аккаунт"
+    
+    def test_placed_path_is_found_by_another_pool(self):
+        """Тест: Папку, размещённую другим процессом не по хешу, находит опрос аккаунтов"""
+        tokens = ['token_a', 'token_b', 'token_c']
+        probe = YandexDiskClientPool(tokens=tokens)
+        folder = 'moved_folder'
+        hashed = probe.hashed_client_for_path(folder)
+        owner_token = next(token for token in tokens if token != hashed.token)
+        
+        # Новый пул (другой процесс): закреплений нет, папка лежит не на аккаунте по хешу
+        pool = YandexDiskClientPool(tokens=tokens)
+        for client in pool.clients:
+            client._session = FakeSession(resources=[folder] if client.token == owner_token else [])
+        
+        assert pool.client_for_path(f"{folder}/file.txt").token == owner_token, \
+            "Папка не найдена на аккаунте, где она лежит"
+        requests_made = pool.get_metrics()['requests']
+        assert pool.client_for_path(folder).token == owner_token
+        assert pool.get_metrics()['requests'] == requests_made, \
+            "Найденный аккаунт не закреплён, опрос повторяется"
+    
+    def test_new_path_stays_on_hashed_account(self):
+        """Тест: Путь, которого нет ни на одном аккаунте, направляется по кольцу без закрепления"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b', 'token_c'])
+        for client in pool.clients:
+            client._session = FakeSession()
+        
+        assert pool.client_for_path('brand_new/file.txt') is pool.hashed_client_for_path('brand_new'), \
+            "Новый путь направлен не по кольцу хешей"
+        assert pool.get_metrics()['requests'] == len(pool), "Опрошены не все аккаунты"
+    
+    def test_open_stream_counts_as_load(self):
+        """Тест: Открытый поток скачивания держит аккаунт "в работе" до закрытия"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b'])
+        busy, idle = pool.clients
+        busy._session = FakeSession(content=b'x' * 1024)
+        
+        # Второй аккаунт сделал больше запросов, но ни одного в работе
+        for _ in range(5):
+            with idle.metrics.track():
+                pass
+        
+        download = busy.open_download_stream('big_file.bin')
+        assert download is not None, "Не удалось открыть поток скачивания"
+        assert busy.metrics.in_flight == 1, "Открытый поток не учтён как запрос в работе"
+        assert pool.least_loaded_client() is idle, \
+            "Аккаунт с открытым потоком считается свободным"
+        
+        download.close()
+        download.close()
+        assert busy.metrics.in_flight == 0, "Поток не освобождён после закрытия"
+        assert pool.least_loaded_client() is busy
+    
+    def test_copy_between_streams_without_temp_file(self, monkeypatch):
+        """Тест: Копирование между аккаунтами идёт потоком, без временного файла"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b'])
+        source, target = pool.clients
+        content = b'0123456789' * 300000
+        source._session = FakeSession(content=content)
+        target._session = FakeSession()
+        
+        def no_files(*args, **kwargs):
+            raise AssertionError("Копирование не должно создавать файлы")
+        
+        with monkeypatch.context() as patch:
+            patch.setattr('builtins.open', no_files)
+            patch.setattr('tempfile.TemporaryFile', no_files)
+            patch.setattr('tempfile.NamedTemporaryFile', no_files)
+            patch.setattr('tempfile.mkstemp', no_files)
+            response = pool.copy_between(source, 'src.bin', target, 'dst.bin')
+        
+        assert response.status_code == 201, "Копирование не удалось"
+        upload = target._session.uploads[0]
+        assert not isinstance(upload['data'], (bytes, io.IOBase)), \
+            "Данные загружаются не потоком"
+        assert hasattr(upload['data'], '__next__'), "Ожидался итератор iter_content"
+        assert upload['body'] == content, "Содержимое копии не совпадает"
+        assert len(source._session.closed) == 1, "Поток скачивания не закрыт"
+        assert pool.get_metrics()['in_flight'] == 0, "Остались незавершённые запросы"
+    
+    def test_copy_between_closes_download_on_failure(self):
+        """Тест: Поток скачивания закрывается, если загрузка не удалась"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b'])
+        source, target = pool.clients
+        source._session = FakeSession(content=b'data')
+        target._session = FakeSession(upload_href=None)
+        
+        with pytest.raises(ValueError):
+            pool.copy_between(source, 'src.bin', target, 'dst.bin')
+        
+        assert len(source._session.closed) == 1, "Поток скачивания не закрыт после ошибки"
+        assert source.metrics.in_flight == 0, "Поток скачивания остался в работе"
+    
+    def test_open_download_stream_closes_failed_response(self):
+        """Тест: Неуспешный ответ скачивания закрывается сразу"""
+        pool = YandexDiskClientPool(tokens=['token_a'])
+        client = pool.clients[0]
+        client._session = FakeSession(download_status=500)
+        
+        assert client.open_download_stream('src.bin') is None
+        assert len(client._session.closed) == 1, "Неуспешный ответ не закрыт"
+        assert client.metrics.in_flight == 0, "Неуспешный ответ остался в работе"
+    
+    def test_copy_between_without_download_link(self):
+        """Тест: Без ссылки на скачивание копирование завершается ValueError"""
+        pool = YandexDiskClientPool(tokens=['token_a', 'token_b'])
+        source, target = pool.clients
+        source._session = FakeSession(download_href=None)
+        target._session = FakeSession()
+        
+        with pytest.raises(ValueError):
+            pool.copy_between(source, 'missing.bin', target, 'dst.bin')
+        
+        assert target._session.uploads == [], "Загрузка не должна начинаться"
+    
+    def test_pool_requires_tokens(self):
+        """Тест: Пул без токенов не создаётся"""
+        with pytest.raises(ValueError):
+            YandexDiskClientPool(tokens=[])
+    
+    @pytest.mark.api
+    @pytest.mark.post
+    def test_copy_between_accounts(self, config, test_file_path, unique_file_name):
+        """Тест: Потоковое копирование файла между аккаунтами"""
+        tokens = config.get_tokens()
+        if len(tokens) < 2:
+            pytest.skip("Для теста нужны минимум два токена в YANDEX_DISK_TOKENS")
+        
+        pool = YandexDiskClientPool(tokens=tokens[:2], config=config)
+        source, target = pool.clients
+        file_name = f"{unique_file_name}.txt"
+        
+        response = source.upload_file(file_name, test_file_path)
+        assert response.status_code == 201, f"Не удалось загрузить файл: {response.text}"
+        
+        try:
+            response = pool.copy_between(source, file_name, target, file_name)
+            assert response.status_code == 201, \
+                f"Не удалось скопировать файл между аккаунтами: {response.text}"
+            assert wait_for_resource(target, file_name), \
+                "Файл не появился на втором аккаунте"
+            
+            metadata_response = target.get_metadata(file_name)
+            assert_status_code(metadata_response, 200, "Не удалось получить метаданные копии")
+        finally:
+            source.delete_resource(file_name, permanently=True)
+            target.delete_resource(file_name, permanently=True)
@@ -0,0 +1,61 @@
+import threading
+import pytest
+from utils.api_client import YandexDiskClient
+from utils.config import ClientConfig
+
+class TestClientConfig:
+    """Тесты для конфигурации и создания клиента"""
+    
+    def test_config_from_env(self, tmp_path):
+        """Тест: Конфигурация из .env, переменные окружения имеют приоритет"""
+        env_file = tmp_path / '.env'
+        env_file.write_text(
+            "YANDEX_DISK_TOKEN=file_token\n"
+            "YANDEX_DISK_TOKENS=token_a, token_b\n"
+            "TEST_PREFIX=from_file_\n"
+        )
+        
+        config = ClientConfig.from_env(str(env_file), environ={'TEST_PREFIX': 'from_env_'})
+        
+        assert config.token == 'file_token', "Токен не прочитан из .env"
+        assert config.get_tokens() == ['token_a', 'token_b'], "Неверный список токенов"
+        assert config.test_prefix == 'from_env_', "Переменная окружения должна иметь приоритет"
+        assert config.api_url == ClientConfig.DEFAULT_API_URL, "Неверный URL по умолчанию"
+    
+    def test_client_token_is_first_argument(self):
+        """Тест: Токен передаётся первым аргументом, конфигурация - только по имени"""
+        config = ClientConfig(token='config_token', api_url='https://example.test/v1/disk')
+        
+        client = YandexDiskClient('account_token', config=config)
+        
+        assert client.token == 'account_token', "Токен не взят из первого аргумента"
+        assert client.base_url == config.api_url, "Конфигурация не применена"
+        with pytest.raises(TypeError):
+            YandexDiskClient('account_token', 0, config)
+    
+    def test_lazy_session_is_shared_between_threads(self):
+        """Тест: Потоки, одновременно делающие первый запрос, получают одну сессию"""
+        client = YandexDiskClient('account_token', config=ClientConfig())
+        barrier = threading.Barrier(8)
+        sessions = []
+        
+        def first_request():
+            barrier.wait()
+            sessions.append(client.session)
+        
+        threads = [threading.Thread(target=first_request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len({id(session) for session in sessions}) == 1, \
+            "Разные потоки создали разные сессии"
+    
+    def test_config_without_token(self):
+        """Тест: Без токена заголовки не формируются"""
+        config = ClientConfig.from_env(None, environ={})
+        
+        assert config.get_tokens() == [], "Без токенов список должен быть пустым"
+        with pytest.raises(ValueError):
+            config.get_headers()
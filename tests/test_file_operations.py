@@ -1,7 +1,6 @@
 import pytest
 import requests
 from utils.helpers import assert_status_code, wait_for_resource
-from utils.config import Config
 
 class TestFileOperations:
     """Тесты для операций с файлами"""
@@ -0,0 +1,62 @@
+import pytest
+from utils import helpers
+from utils.helpers import RateLimiter
+
+class FakeClock:
+    """Подмена модуля time: sleep сдвигает monotonic без реального ожидания"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Фикстура для управляемых часов в utils.helpers"""
+    fake = FakeClock()
+    monkeypatch.setattr(helpers, 'time', fake)
+    return fake
+
+class TestRateLimiter:
+    """Тесты для ограничителя частоты запросов"""
+    
+    @pytest.mark.smoke
+    def test_acquire_throttles_to_rate(self, clock):
+        """Тест: Запросы сверх burst выполняются не чаще rate в секунду"""
+        limiter = RateLimiter(rate=2, burst=1)
+        
+        for _ in range(5):
+            limiter.acquire()
+        
+        assert clock.now == pytest.approx(2.0), \
+            f"5 запросов при 2 запросах/сек должны занять 2 сек, заняли {clock.now}"
+        assert all(wait == pytest.approx(0.5) for wait in clock.sleeps), \
+            f"Неверные паузы между запросами: {clock.sleeps}"
+    
+    def test_burst_is_not_throttled(self, clock):
+        """Тест: Запросы в пределах burst проходят без ожидания, корзина пополняется со временем"""
+        limiter = RateLimiter(rate=1, burst=3)
+        
+        for _ in range(3):
+            limiter.acquire()
+        assert clock.sleeps == [], "Запросы в пределах burst не должны ждать"
+        
+        clock.now += 10
+        for _ in range(3):
+            limiter.acquire()
+        assert clock.sleeps == [], "Корзина не пополнилась за время простоя"
+    
+    def test_zero_rate_is_unlimited(self, clock):
+        """Тест: rate=0 отключает ограничение"""
+        limiter = RateLimiter(rate=0)
+        
+        for _ in range(100):
+            limiter.acquire()
+        
+        assert clock.sleeps == [], "При rate=0 ожидания быть не должно"
@@ -0,0 +1,25 @@
+import pytest
+from benchmarks.import_time import measure_import
+
+# Бюджет холодного импорта клиента (мс); до ленивой загрузки было ~100 мс
+IMPORT_BUDGET_MS = 50
+
+class TestImportTime:
+    """Тесты для времени запуска"""
+    
+    @pytest.mark.smoke
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Тест: Импорт клиента не загружает requests, dotenv и uuid"""
+        result = measure_import()
+        
+        assert result['loaded'] == [], \
+            f"При импорте загружены тяжёлые модули: {result['loaded']}"
+    
+    @pytest.mark.benchmark
+    def test_import_time_budget(self):
+        """Тест: Холодный импорт клиента укладывается в бюджет"""
+        # Лучший из нескольких замеров, чтобы не зависеть от шума на машине
+        elapsed = min(measure_import()['ms'] for _ in range(3))
+        
+        assert elapsed < IMPORT_BUDGET_MS, \
+            f"Импорт занял {elapsed:.1f} мс, бюджет {IMPORT_BUDGET_MS} мс"
@@ -1,6 +1,5 @@
 import pytest
 from utils.helpers import assert_status_code
-from utils.config import Config
 
 class TestMetadata:
     """Тесты для работы с метаданными"""
@@ -54,9 +53,9 @@ class TestMetadata:
     
     @pytest.mark.api
     @pytest.mark.get
-    def test_get_nonexistent_resource_metadata(self, api_client):
+    def test_get_nonexistent_resource_metadata(self, api_client, test_prefix):
         """Тест: Получение метаданных несуществующего ресурса"""
-        nonexistent_path = f"{Config.TEST_PREFIX}nonexistent_{Config.TEST_PREFIX}"
+        nonexistent_path = f"{test_prefix}nonexistent_{test_prefix}"
         
         response = api_client.get_metadata(nonexistent_path)
         assert_status_code(response, 404, "Несуществующий ресурс должен возвращать 404")
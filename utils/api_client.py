@@ -1,13 +1,101 @@
-import requests
-from typing import Optional
-from utils.config import Config
+from __future__ import annotations
 
-class YandexDiskClient:
-    """Клиент для работы с Яндекс.Диском API"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
+from utils.config import ClientConfig, get_config
+from utils.helpers import RateLimiter
+
+if TYPE_CHECKING:
+    import requests
+
+CHUNK_SIZE = 1024 * 1024
+
+class ClientMetrics:
+    """Счётчики запросов одного клиента (потокобезопасные)"""
+    
+    FIELDS = ('requests', 'errors', 'in_flight', 'total_time')
     
     def __init__(self):
-        self.base_url = Config.API_URL
-        self.timeout = Config.TIMEOUT
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_time = 0.0
+    
+    def begin(self) -> Callable[[bool], None]:
+        """Начать учёт запроса; возвращает функцию завершения finish(failed)
+        Повторные вызовы finish ничего не делают - запрос учитывается один раз.
+        """
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+        start = time.monotonic()
+        finished = False
+        
+        def finish(failed: bool = False):
+            nonlocal finished
+            with self._lock:
+                if finished:
+                    return
+                finished = True
+                self.in_flight -= 1
+                self.total_time += time.monotonic() - start
+                if failed:
+                    self.errors += 1
+        
+        return finish
+    
+    @contextmanager
+    def track(self):
+        """Учёт одного запроса: количество, ошибки, время, запросы в работе"""
+        finish = self.begin()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            finish(failed)
+    
+    def mark_error(self):
+        """Отметить запрос, завершившийся ошибочным статусом"""
+        with self._lock:
+            self.errors += 1
+    
+    def as_dict(self) -> dict:
+        """Снимок счётчиков"""
+        with self._lock:
+            return {field: getattr(self, field) for field in self.FIELDS}
+
+class YandexDiskClient:
+    """Клиент для работы с Яндекс.Диском API
+    token: OAuth-токен аккаунта (по умолчанию - config.token)
+    rate_limit: запросов в секунду к cloud-api (по умолчанию - config.rate_limit); передача
+        содержимого по ссылкам загрузки/скачивания идёт на другие хосты без токена и не ограничивается
+    config: конфигурация, только по имени (по умолчанию - get_config())
+    """
+    
+    def __init__(self, token: Optional[str] = None, rate_limit: Optional[float] = None, *,
+                 config: Optional[ClientConfig] = None):
+        self.config = config or get_config()
+        self.base_url = self.config.api_url
+        self.timeout = self.config.timeout
+        self.token = token or self.config.token
+        self.rate_limiter = RateLimiter(self.config.rate_limit if rate_limit is None else rate_limit)
+        self.metrics = ClientMetrics()
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Отдельный пул соединений на каждый клиент (аккаунт), создаётся при первом запросе"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    self._session = requests.Session()
+        return self._session
     
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Базовый метод для выполнения запросов"""
@@ -15,10 +103,38 @@ class YandexDiskClient:
         
         # Заголовки: Content-Type только для запросов с телом
         include_content_type = method in ['POST', 'PUT', 'PATCH']
-        kwargs['headers'] = Config.get_headers(include_content_type=include_content_type)
-        kwargs['timeout'] = self.timeout
+        kwargs['headers'] = self.config.get_headers(include_content_type=include_content_type, token=self.token)
+        
+        self.rate_limiter.acquire()
+        return self._send(method, url, **kwargs)
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Отправка запроса через сессию клиента с учётом метрик
+        Для stream=True запрос остаётся "в работе" до закрытия ответа, а не до получения заголовков.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        finish = self.metrics.begin()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            finish(True)
+            raise
+        
+        if response.status_code >= 400:
+            self.metrics.mark_error()
         
-        response = requests.request(method, url, **kwargs)
+        if kwargs.get('stream'):
+            close = response.close
+            
+            def close_and_finish():
+                try:
+                    close()
+                finally:
+                    finish()
+            
+            response.close = close_and_finish
+        else:
+            finish()
         return response
     
     # ========== DISK INFO ==========
@@ -86,10 +202,19 @@ class YandexDiskClient:
         
         # Загрузка файла: БЕЗ заголовка Content-Type (автоопределение)
         with open(file_path, 'rb') as f:
-            response = requests.put(upload_link, data=f, timeout=self.timeout)
+            response = self._send('PUT', upload_link, data=f)
         
         return response
     
+    def upload_stream(self, path: str, data: Union[bytes, Iterable[bytes]], overwrite: bool = False) -> requests.Response:
+        """Загрузить данные на диск из потока (итератора байтовых блоков)"""
+        upload_link = self.get_upload_link(path, overwrite)
+        
+        if not upload_link:
+            raise ValueError(f"Не удалось получить ссылку для загрузки: {path}")
+        
+        return self._send('PUT', upload_link, data=data)
+    
     # ========== DOWNLOAD ==========
     def get_download_link(self, path: str) -> Optional[str]:
         """GET /resources/download - Получить ссылку для скачивания файла"""
@@ -107,14 +232,27 @@ class YandexDiskClient:
         if not download_link:
             return False
         
-        response = requests.get(download_link, timeout=self.timeout)
-        
-        if response.status_code == 200:
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            return True
+        with self._send('GET', download_link, stream=True) as response:
+            if response.status_code == 200:
+                with open(save_path, 'wb') as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+                return True
         return False
     
+    def open_download_stream(self, path: str) -> Optional[requests.Response]:
+        """Открыть потоковое скачивание файла (ответ нужно закрыть после чтения)"""
+        download_link = self.get_download_link(path)
+        
+        if not download_link:
+            return None
+        
+        response = self._send('GET', download_link, stream=True)
+        if response.status_code != 200:
+            response.close()
+            return None
+        return response
+    
     # ========== PUBLISH ==========
     def publish_resource(self, path: str) -> requests.Response:
         """PUT /resources/publish - Опубликовать ресурс"""
@@ -0,0 +1,172 @@
+import bisect
+import hashlib
+import itertools
+import threading
+from typing import Dict, List, Optional
+from utils.api_client import CHUNK_SIZE, ClientMetrics, YandexDiskClient
+from utils.config import ClientConfig, get_config
+
+class YandexDiskClientPool:
+    """Пул клиентов для нескольких аккаунтов Яндекс.Диска
+    У каждого аккаунта свой пул соединений, ограничитель частоты запросов к API и метрики.
+    Путь привязывается к аккаунту консистентным хешированием, либо закрепляется
+    за аккаунтом с наименьшей долей занятого места через place_path. Закрепления хранятся
+    в памяти пула; другой процесс находит такую папку опросом аккаунтов в client_for_path.
+    """
+    
+    REPLICAS = 64
+    
+    def __init__(self, tokens: Optional[List[str]] = None, rate_limit: Optional[float] = None,
+                 config: Optional[ClientConfig] = None):
+        config = config or get_config()
+        tokens = config.get_tokens() if tokens is None else tokens
+        if not tokens:
+            raise ValueError(
+                "Не найдено ни одного токена. "
+                "Укажите YANDEX_DISK_TOKEN или YANDEX_DISK_TOKENS в .env."
+            )
+        self.clients = [YandexDiskClient(token, rate_limit, config=config) for token in tokens]
+        
+        # Кольцо хешей: несколько виртуальных узлов на аккаунт для равномерности.
+        # Узлы привязаны к хешу токена, а не к позиции в списке: порядок токенов
+        # и удаление одного из них не перемещают пути остальных аккаунтов.
+        ring = []
+        for index, token in enumerate(tokens):
+            account_id = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+            for replica in range(self.REPLICAS):
+                ring.append((self._hash(f"{account_id}:{replica}"), index))
+        ring.sort()
+        self._ring_keys = [key for key, _ in ring]
+        self._ring_clients = [index for _, index in ring]
+        
+        # Закреплённые верхнеуровневые ресурсы: ключ шардирования -> индекс клиента
+        self._placements: Dict[str, int] = {}
+        # Доля занятого места по аккаунтам (get_disk_info), читается один раз на пул
+        self._disk_usage: Dict[int, Optional[float]] = {}
+        # Счётчик для разбиения ничьих по кругу
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.clients)
+    
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode('utf-8')).digest()[:8], 'big')
+    
+    @staticmethod
+    def _shard_key(path: str) -> str:
+        """Ключ шардирования - верхнеуровневый ресурс, чтобы папка и её файлы жили на одном аккаунте"""
+        return path.strip('/').split('/', 1)[0]
+    
+    # ========== ROUTING ==========
+    def _ring_index(self, path: str) -> int:
+        position = bisect.bisect(self._ring_keys, self._hash(self._shard_key(path)))
+        return self._ring_clients[position % len(self._ring_keys)]
+    
+    def hashed_client_for_path(self, path: str) -> YandexDiskClient:
+        """Клиент аккаунта по кольцу хешей, без закреплений и запросов к API"""
+        return self.clients[self._ring_index(path)]
+    
+    def client_for_path(self, path: str) -> YandexDiskClient:
+        """Клиент аккаунта, на котором лежит путь
+        Порядок: закрепление в пуле, затем аккаунт по кольцу хешей. Если там верхнеуровневого
+        ресурса нет (404), опрашиваются остальные аккаунты - так находятся папки, размещённые
+        через place_path в другом процессе. Найденный аккаунт закрепляется в пуле. Если ресурса
+        нет нигде (новый путь), возвращается аккаунт по кольцу без закрепления.
+        """
+        key = self._shard_key(path)
+        index = self._placements.get(key)
+        if index is not None:
+            return self.clients[index]
+        
+        hashed = self._ring_index(path)
+        if not key:
+            return self.clients[hashed]
+        
+        status_code = self.clients[hashed].get_metadata(key).status_code
+        if status_code == 200:
+            return self._pin(key, hashed)
+        if status_code == 404:
+            for index in range(len(self.clients)):
+                if index != hashed and self.clients[index].get_metadata(key).status_code == 200:
+                    return self._pin(key, index)
+        return self.clients[hashed]
+    
+    def _pin(self, key: str, index: int) -> YandexDiskClient:
+        """Закрепить верхнеуровневый ресурс за аккаунтом (первое закрепление выигрывает)"""
+        with self._lock:
+            return self.clients[self._placements.setdefault(key, index)]
+    
+    def _rotated_indexes(self) -> List[int]:
+        """Индексы клиентов, начиная каждый раз со следующего: min() разбивает ничьи по кругу"""
+        start = next(self._turn) % len(self.clients)
+        return list(range(start, len(self.clients))) + list(range(start))
+    
+    def least_loaded_client(self) -> YandexDiskClient:
+        """Наименее загруженный клиент: меньше запросов в работе, затем всего запросов
+        Нагрузка - счётчики запросов этого процесса (для распределения запросов, не данных);
+        при равенстве клиенты выбираются по кругу. Для новых записей используйте place_path.
+        """
+        index = min(self._rotated_indexes(),
+                    key=lambda i: (self.clients[i].metrics.in_flight, self.clients[i].metrics.requests))
+        return self.clients[index]
+    
+    def get_disk_usage(self, index: int) -> Optional[float]:
+        """Доля занятого места аккаунта (used_space / total_space), None - если недоступна
+        Запрашивается через get_disk_info один раз и кэшируется в пуле.
+        """
+        if index not in self._disk_usage:
+            usage = None
+            response = self.clients[index].get_disk_info()
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('total_space'):
+                    usage = data.get('used_space', 0) / data['total_space']
+            self._disk_usage[index] = usage
+        return self._disk_usage[index]
+    
+    def least_used_client(self) -> YandexDiskClient:
+        """Аккаунт с наименьшей долей занятого места на диске
+        Аккаунты без данных о месте - в конце; при равенстве выбор идёт по кругу.
+        """
+        def usage_key(index):
+            usage = self.get_disk_usage(index)
+            return (usage is None, usage or 0)
+        
+        return self.clients[min(self._rotated_indexes(), key=usage_key)]
+    
+    def place_path(self, path: str) -> YandexDiskClient:
+        """Выбрать аккаунт для нового верхнеуровневого ресурса и закрепить его
+        Верхнеуровневый ресурс пути отдаётся аккаунту с наименьшей долей занятого места,
+        после чего client_for_path направляет на него этот ресурс и всё, что внутри.
+        Уже закреплённый ресурс остаётся на своём аккаунте.
+        """
+        key = self._shard_key(path)
+        with self._lock:
+            if key not in self._placements:
+                self._placements[key] = self.clients.index(self.least_used_client())
+            return self.clients[self._placements[key]]
+    
+    # ========== METRICS ==========
+    def get_metrics(self) -> Dict[str, float]:
+        """Суммарные метрики по всем аккаунтам"""
+        total = dict.fromkeys(ClientMetrics.FIELDS, 0)
+        for client in self.clients:
+            for field, value in client.metrics.as_dict().items():
+                total[field] += value
+        return total
+    
+    # ========== CROSS-ACCOUNT ==========
+    def copy_between(self, source: YandexDiskClient, from_path: str,
+                     target: YandexDiskClient, to_path: str, overwrite: bool = False):
+        """Копировать файл между аккаунтами потоком скачивание -> загрузка, без записи на диск"""
+        if source is target:
+            return source.copy_resource(from_path, to_path, overwrite)
+        
+        download = source.open_download_stream(from_path)
+        if download is None:
+            raise ValueError(f"Не удалось открыть файл для скачивания: {from_path}")
+        
+        with download:
+            return target.upload_stream(to_path, download.iter_content(CHUNK_SIZE), overwrite)
@@ -1,35 +1,94 @@
 import os
-from dotenv import load_dotenv
+import threading
+from typing import Dict, List, Mapping, Optional
 
-load_dotenv()
+# .env в корне проекта (как и раньше, независимо от текущей директории)
+DEFAULT_ENV_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
 
-class Config:
-    """Конфигурация для тестов"""
+class ClientConfig:
+    """Конфигурация клиента и тестов
+    Создаётся явно (ClientConfig(...) / ClientConfig.from_env()) или берётся через get_config().
+    Ничего не читает при импорте модуля.
+    """
     
-    # API Configuration
-    API_URL = os.getenv('YANDEX_DISK_API_URL', 'https://cloud-api.yandex.net/v1/disk')
-    TOKEN = os.getenv('YANDEX_DISK_TOKEN')
+    DEFAULT_API_URL = 'https://cloud-api.yandex.net/v1/disk'
+    DEFAULT_TEST_PREFIX = 'test_yd_api_'
     
-    # Test Configuration
-    TEST_PREFIX = os.getenv('TEST_PREFIX', 'test_yd_api_')
-    TIMEOUT = 30
+    def __init__(self, token: Optional[str] = None, tokens: Optional[List[str]] = None,
+                 api_url: str = DEFAULT_API_URL, test_prefix: str = DEFAULT_TEST_PREFIX,
+                 timeout: float = 30, rate_limit: float = 0,
+                 test_file_path: str = 'data/test_file.txt',
+                 test_image_path: str = 'data/test_image.png'):
+        # API Configuration
+        self.api_url = api_url
+        self.token = token
+        # Несколько аккаунтов (по умолчанию - один token)
+        self.tokens = list(tokens or [])
+        # Ограничение частоты запросов на один токен (запросов в секунду, 0 - без ограничения)
+        self.rate_limit = rate_limit
+        
+        # Test Configuration
+        self.test_prefix = test_prefix
+        self.timeout = timeout
+        
+        # Test Data
+        self.test_file_path = test_file_path
+        self.test_image_path = test_image_path
     
-    # Test Data
-    TEST_FILE_PATH = 'data/test_file.txt'
-    TEST_IMAGE_PATH = 'data/test_image.png'
+    def __repr__(self) -> str:
+        return (f"ClientConfig(api_url={self.api_url!r}, accounts={len(self.get_tokens())}, "
+                f"test_prefix={self.test_prefix!r}, timeout={self.timeout!r}, rate_limit={self.rate_limit!r})")
     
     @classmethod
-    def get_headers(cls, include_content_type=True):
+    def from_env(cls, env_file: Optional[str] = DEFAULT_ENV_FILE, environ: Optional[Mapping[str, str]] = None) -> 'ClientConfig':
+        """Собрать конфигурацию из переменных окружения и .env
+        Переменные окружения имеют приоритет над .env; os.environ не изменяется.
+        """
+        values: Dict[str, Optional[str]] = {}
+        if env_file and os.path.exists(env_file):
+            from dotenv import dotenv_values
+            values.update(dotenv_values(env_file))
+        values.update(os.environ if environ is None else environ)
+        
+        tokens = [t.strip() for t in (values.get('YANDEX_DISK_TOKENS') or '').split(',') if t.strip()]
+        return cls(
+            token=values.get('YANDEX_DISK_TOKEN') or None,
+            tokens=tokens,
+            api_url=values.get('YANDEX_DISK_API_URL') or cls.DEFAULT_API_URL,
+            test_prefix=values.get('TEST_PREFIX') or cls.DEFAULT_TEST_PREFIX,
+            rate_limit=float(values.get('YANDEX_DISK_RATE_LIMIT') or 0),
+        )
+    
+    def get_tokens(self) -> List[str]:
+        """Возвращает список токенов для пула клиентов"""
+        if self.tokens:
+            return list(self.tokens)
+        return [self.token] if self.token else []
+    
+    def get_headers(self, include_content_type=True, token=None):
         """Возвращает заголовки для запросов"""
-        if not cls.TOKEN:
+        token = token or self.token
+        if not token:
             raise ValueError(
                 "YANDEX_DISK_TOKEN не найден. "
                 "Скопируйте .env.example в .env и добавьте ваш токен."
             )
         headers = {
-            'Authorization': f'OAuth {cls.TOKEN}',
+            'Authorization': f'OAuth {token}',
             'Accept': 'application/json'
         }
         if include_content_type:
             headers['Content-Type'] = 'application/json'
         return headers
+
+_default_config: Optional[ClientConfig] = None
+_default_config_lock = threading.Lock()
+
+def get_config() -> ClientConfig:
+    """Конфигурация по умолчанию: читается из окружения и .env при первом обращении"""
+    global _default_config
+    if _default_config is None:
+        with _default_config_lock:
+            if _default_config is None:
+                _default_config = ClientConfig.from_env()
+    return _default_config
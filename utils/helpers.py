@@ -1,6 +1,12 @@
+from __future__ import annotations
+
+import os
+import threading
 import time
-from typing import Callable
-from requests import Response
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from requests import Response
 
 def wait_for_resource(client, path: str, timeout: int = 30, check_exists: bool = True) -> bool:
     """Ожидание появления/исчезновения ресурса"""
@@ -34,10 +40,36 @@ def retry_on_failure(max_attempts: int = 3, delay: int = 2):
         return wrapper
     return decorator
 
+class RateLimiter:
+    """Ограничитель частоты запросов (token bucket)
+    rate: запросов в секунду (0 - без ограничения), burst: размер "корзины"
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Дождаться разрешения на выполнение запроса"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 def generate_unique_name(prefix: str) -> str:
     """Генерация уникального имени с временной меткой"""
-    import uuid
-    return f"{prefix}{uuid.uuid4().hex[:8]}"
+    return f"{prefix}{os.urandom(4).hex()}"
 
 def assert_status_code(response: Response, expected_code: int, message: str = ""):
     """Проверка статус кода с информативным сообщением"""